@@ -54,6 +54,11 @@ class App(ctk.CTk):
         self.ui.status_label.configure(text=status_msg)
 
         res = library.export_book(book)
+        if res is None:
+            status_msg += "\n\nresult: book data doesn't match the Notion database schema"
+            self.ui.status_label.configure(text=status_msg)
+            return
+
         result_json = json.loads(res.text)
         status_msg += "\n\ncode: " + str(res.status_code)
         status_msg += "\nresult: " + json.dumps(result_json, indent=2, ensure_ascii=False)
@@ -12,6 +12,7 @@ import os
 from requests import Response
 from src.domain.model.book import Book
 from src.domain.service.loader_service import LoaderService
+from src.infrastructure.cache.cache_cover import CacheCover
 from src.infrastructure.cache.cache_image import CacheImage
 from src.infrastructure.external.livelib_client import LiveLibClient
 from src.infrastructure.external.mif_client import MifClient
@@ -78,7 +79,7 @@ class LibraryService:
         """Save current book data to a Markdown file using Obsidian.
 
         Returns:
-            str: Path to the saved file or error message
+            str: Path to the saved file with cover bytes saved, or error message
         """
 
         if not self.current_book:
@@ -86,17 +87,39 @@ class LibraryService:
 
         obsidian = ObsidianClient()
 
-        return obsidian.save_to_notes(
-            self.current_book,
-            cache_image.get(self.current_book.image_name)
-        )
+        image_path = cache_image.get(self.current_book.image_name)
+        cover = CacheCover.from_env().get(image_path)
+        if cover is None:
+            return obsidian.save_to_notes(self.current_book, image_path)
+
+        result = obsidian.save_to_notes(self.current_book, cover.path)
+
+        return f"{result}\nCover bytes saved: {cover.bytes_saved}"
+
+    @staticmethod
+    def optimize_covers(image_names: list[str]) -> str:
+        """Optimize a batch of cached book covers for the vault.
+
+        Args:
+            image_names (list[str]): Names of the cached cover images
+
+        Returns:
+            str: Summary with the number of optimized covers and bytes saved
+        """
+
+        image_paths = [cache_image.get_image_path(image_name) for image_name in image_names]
+        covers = CacheCover.from_env().optimize_batch(image_paths)
+        bytes_saved = sum(cover.bytes_saved for cover in covers)
+
+        return f"Covers optimized: {len(covers)}, bytes saved: {bytes_saved}"
 
     @staticmethod
-    def export_book(book: Book) -> Response:
+    def export_book(book: Book) -> Response | None:
         """Export book data to a Notion database.
 
         Returns:
-            str: URL of the created Notion page
+            Response: Response of the Notion API, or None if the book data
+                      doesn't match the database schema
         """
 
         notion = NotionClient(
@@ -105,3 +128,19 @@ class LibraryService:
         )
 
         return notion.create_book_edition_page(book)
+
+    @staticmethod
+    def export_books(books: list[Book]) -> list[Response | None]:
+        """Export a batch of books to a Notion database.
+
+        Returns:
+            list: Response of the Notion API for each book, or None for books
+                  whose data doesn't match the database schema
+        """
+
+        notion = NotionClient(
+            os.environ.get('NOTION_API_KEY', None),
+            os.environ.get('NOTION_DATABASE_ID', None)
+        )
+
+        return notion.create_book_edition_pages(books)
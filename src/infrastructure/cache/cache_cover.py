@@ -0,0 +1,329 @@
+"""
+Module for caching optimized book covers.
+
+Resizes cached cover images to a maximum dimension, re-encodes them to a compact
+format and strips their metadata, so full-resolution covers don't bloat the vault.
+Optimized covers are stored in the 'cache' directory at the project root, keyed by
+the hash of the source image and the optimization settings.
+
+Classes:
+    OptimizedCover: Result of a single cover optimization.
+    CacheCover: Handles cover optimization and caching operations.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+import hashlib
+import io
+import os
+import os.path
+from PIL import Image, ImageCms, ImageOps
+
+
+@dataclass
+class OptimizedCover:
+    """Class for describe an optimized cover."""
+
+    source_path: str  # Path to the original cached image
+    path: str  # Path to the optimized image, or the original one if it isn't smaller
+    source_size: int  # Original image size in bytes
+    size: int  # Optimized image size in bytes
+
+    @property
+    def bytes_saved(self) -> int:
+        """Number of bytes saved by the optimization (zero if the original is kept)."""
+        return self.source_size - self.size
+
+
+class CacheCover:
+    """Class for optimizing and caching book cover images."""
+
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../storage/cache/cover")
+
+    MAX_SIZE = 1200
+    IMAGE_FORMAT = 'WEBP'
+    QUALITY = 80
+
+    EXTENSIONS = {
+        'WEBP': '.webp',
+        'JPEG': '.jpg',
+        'PNG': '.png',
+    }
+
+    # Errors Pillow raises for unreadable images, bad settings and oversized images
+    ERRORS = (OSError, ValueError, Image.DecompressionBombError)
+
+    def __init__(self, max_size: int | None = None, image_format: str | None = None,
+                 quality: int | None = None):
+        """Initialize the cover cache with optimization settings.
+
+        Args:
+            max_size: Maximum width and height of the optimized cover in pixels, at least 1.
+            image_format: Pillow format name of the optimized cover ('WEBP', 'JPEG', 'PNG').
+            quality: Encoder quality, clamped to the range from 1 to 100.
+        """
+        self.max_size = max(max_size, 1) if max_size is not None else self.MAX_SIZE
+        self.image_format = (image_format or self.IMAGE_FORMAT).upper()
+        self.quality = min(max(quality, 1), 100) if quality is not None else self.QUALITY
+
+        if self.image_format not in self.EXTENSIONS:
+            raise ValueError(f'Unsupported cover format: {self.image_format}')
+
+    @classmethod
+    def from_env(cls) -> 'CacheCover':
+        """Create the cover cache with settings from the environment variables.
+
+        Invalid values are reported and replaced with the defaults.
+
+        Returns:
+            The cover cache configured by COVER_MAX_SIZE, COVER_FORMAT and COVER_QUALITY.
+        """
+        image_format = os.environ.get('COVER_FORMAT')
+        if image_format and image_format.upper() not in cls.EXTENSIONS:
+            print(f'Unsupported COVER_FORMAT, using {cls.IMAGE_FORMAT}: {image_format}')
+            image_format = None
+
+        max_size = cls._get_int_env('COVER_MAX_SIZE')
+        if max_size is not None and max_size <= 0:
+            print(f'Invalid COVER_MAX_SIZE, using default: {max_size}')
+            max_size = None
+
+        return cls(
+            max_size,
+            image_format,
+            cls._get_int_env('COVER_QUALITY')
+        )
+
+    def get(self, image_path: str | None) -> OptimizedCover | None:
+        """Retrieve an optimized cover, creating it if it is not cached yet.
+
+        Args:
+            image_path: Path to the original cover image.
+
+        Returns:
+            The optimized cover, or None if the image is missing or can't be processed.
+        """
+        if not image_path or not os.path.exists(image_path):
+            return None
+
+        try:
+            target_path = self._build_cache_file_path(image_path)
+            if not os.path.exists(target_path):
+                _transcode(image_path, target_path, self.max_size, self.image_format, self.quality)
+        except self.ERRORS as e:
+            print(f'Error optimizing cover {image_path}: {e}')
+            return None
+
+        return self._build_result(image_path, target_path)
+
+    def optimize_batch(self, image_paths: list[str], max_workers: int | None = None) \
+            -> list[OptimizedCover]:
+        """Optimize a batch of covers in a process pool.
+
+        Already optimized covers are taken from the cache without re-encoding.
+
+        Args:
+            image_paths: Paths to the original cover images.
+            max_workers: Maximum number of worker processes (defaults to the CPU count).
+
+        Returns:
+            Optimized covers for every image that was processed successfully.
+        """
+        targets = {}
+        for image_path in image_paths:
+            if not os.path.exists(image_path):
+                print(f'Image not found: {image_path}')
+                continue
+
+            try:
+                targets[image_path] = self._build_cache_file_path(image_path)
+            except OSError as e:
+                print(f'Error optimizing cover {image_path}: {e}')
+
+        # Sources with the same content share a target, which is transcoded only once
+        pending = {
+            target: source
+            for source, target in targets.items()
+            if not os.path.exists(target)
+        }
+
+        failed = set()
+        if pending:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _transcode,
+                        source,
+                        target,
+                        self.max_size,
+                        self.image_format,
+                        self.quality
+                    ): target
+                    for target, source in pending.items()
+                }
+                for future, target in futures.items():
+                    try:
+                        future.result()
+                    except (*self.ERRORS, BrokenProcessPool) as e:
+                        # A crashed worker breaks the pool, failing all remaining targets
+                        print(f'Error optimizing cover {pending[target]}: {e}')
+                        failed.add(target)
+
+        return [
+            self._build_result(source, target)
+            for source, target in targets.items()
+            if target not in failed
+        ]
+
+    def _build_result(self, source_path: str, target_path: str) -> OptimizedCover:
+        """Build an optimization result from the source and optimized files.
+
+        Args:
+            source_path: Path to the original cover image.
+            target_path: Path to the optimized cover image.
+
+        Re-encoding an already small cover can make it larger, in which case the
+        original is kept.
+
+        Returns:
+            The optimized cover with file sizes.
+        """
+        source_size = os.path.getsize(source_path)
+        size = os.path.getsize(target_path)
+
+        if size >= source_size:
+            target_path = source_path
+            size = source_size
+
+        return OptimizedCover(
+            source_path = source_path,
+            path = target_path,
+            source_size = source_size,
+            size = size,
+        )
+
+    def _build_cache_file_path(self, image_path: str) -> str:
+        """Build the full path to the optimized cover for a given source image.
+
+        Args:
+            image_path: Path to the original cover image.
+
+        Returns:
+            Full path to the optimized cover file.
+        """
+        if not os.path.exists(self.CACHE_DIR):
+            os.makedirs(self.CACHE_DIR)
+
+        cache_key = self._get_cache_key(image_path)
+        return os.path.join(self.CACHE_DIR, f"{cache_key}{self.EXTENSIONS[self.image_format]}")
+
+    def _get_cache_key(self, image_path: str) -> str:
+        """Generate MD5 hash for the source image content and optimization settings.
+
+        Args:
+            image_path: Path to the original cover image.
+
+        Returns:
+            MD5 hash as a hexadecimal string.
+        """
+        md5 = hashlib.md5()
+        with open(image_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                md5.update(chunk)
+        md5.update(f'{self.max_size}:{self.image_format}:{self.quality}'.encode())
+
+        return md5.hexdigest()
+
+    @staticmethod
+    def _get_int_env(name: str) -> int | None:
+        """Read an integer setting from an environment variable.
+
+        Args:
+            name: Name of the environment variable.
+
+        Returns:
+            The integer value, or None if the variable is not set or not an integer.
+        """
+        value = os.environ.get(name)
+        if not value:
+            return None
+
+        try:
+            return int(value)
+        except ValueError:
+            print(f'Invalid {name}, using default: {value}')
+            return None
+
+
+def _transcode(source_path: str, target_path: str, max_size: int, image_format: str,
+               quality: int):
+    """Resize, re-encode and strip metadata of an image.
+
+    Defined at module level so it can be pickled for worker processes.
+
+    Args:
+        source_path: Path to the original image.
+        target_path: Path to write the optimized image to.
+        max_size: Maximum width and height in pixels.
+        image_format: Pillow format name of the output image.
+        quality: Encoder quality from 1 to 100.
+    """
+    with Image.open(source_path) as source:
+        icc_profile = source.info.get('icc_profile')
+        # Apply EXIF orientation before the EXIF data is dropped
+        image = ImageOps.exif_transpose(source)
+
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') \
+        or (image.mode == 'P' and 'transparency' in image.info)
+    mode = 'RGBA' if has_alpha and image_format != 'JPEG' else 'RGB'
+
+    # Palette and bilevel images are always resized with NEAREST, so convert them first
+    if image.mode not in ('RGB', 'RGBA', 'CMYK'):
+        image = image.convert(mode)
+
+    if icc_profile:
+        image = _convert_to_srgb(image, icc_profile, mode)
+
+    if image.mode != mode:
+        image = image.convert(mode)
+
+    image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+
+    # Colors are in sRGB now and saved images only carry metadata passed explicitly,
+    # so dropping info strips EXIF, XMP and the color profile
+    image.info.clear()
+
+    # Write to a temporary file first so an interrupted worker never leaves a broken cache entry
+    tmp_path = f'{target_path}.tmp'
+    try:
+        image.save(tmp_path, format=image_format, quality=quality, optimize=True)
+        os.replace(tmp_path, target_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _convert_to_srgb(image: Image.Image, icc_profile: bytes, mode: str) -> Image.Image:
+    """Convert an image from its embedded color profile to sRGB.
+
+    Args:
+        image: Image in RGB, RGBA or CMYK mode.
+        icc_profile: Embedded ICC profile of the image.
+        mode: Mode of the converted image.
+
+    Returns:
+        The converted image, or the original one if the profile can't be applied.
+    """
+    try:
+        converted = ImageCms.profileToProfile(
+            image,
+            ImageCms.ImageCmsProfile(io.BytesIO(icc_profile)),
+            ImageCms.createProfile('sRGB'),
+            outputMode=mode
+        )
+    except (ImageCms.PyCMSError, OSError, ValueError) as e:
+        print(f'Error converting cover to sRGB: {e}')
+        return image
+
+    # profileToProfile only returns None when converting in place
+    return converted if converted is not None else image
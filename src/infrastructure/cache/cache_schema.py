@@ -0,0 +1,82 @@
+"""
+Module for caching Notion database schemas.
+
+Caches database property schemas as JSON files named after the database ID,
+so the schema is fetched from the API at most once per TTL.
+Cache is stored in the 'cache' directory at the project root.
+
+Classes:
+    CacheSchema: Handles database schema caching operations.
+"""
+import json
+import os
+import os.path
+import time
+
+
+class CacheSchema:
+    """Class for caching and retrieving Notion database schemas."""
+
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../storage/cache/schema")
+
+    TTL = 3600  # Seconds before a cached schema is fetched again
+
+    def __init__(self, ttl: int | None = None):
+        """Initialize the schema cache.
+
+        Args:
+            ttl: Seconds before a cached schema expires.
+        """
+        self.ttl = self.TTL if ttl is None else ttl
+
+    def get(self, database_id: str) -> dict | None:
+        """Retrieve a cached schema for a given database.
+
+        Args:
+            database_id: ID of the Notion database.
+
+        Returns:
+            The cached property schema, or None if not found or expired.
+        """
+        cache_file_path = self._build_cache_file_path(database_id)
+        if not os.path.exists(cache_file_path):
+            return None
+
+        if time.time() - os.path.getmtime(cache_file_path) > self.ttl:
+            return None
+
+        try:
+            with open(cache_file_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            print(f"Failed to read cache file {cache_file_path}: {e}")
+            return None
+
+    def save(self, database_id: str, schema: dict):
+        """Save a property schema to cache for a given database.
+
+        Args:
+            database_id: ID of the Notion database.
+            schema: Property schema of the database.
+        """
+        cache_file_path = self._build_cache_file_path(database_id)
+
+        try:
+            with open(cache_file_path, "w", encoding="utf-8") as file:
+                json.dump(schema, file, ensure_ascii=False)
+        except OSError as e:
+            print(f"Error saving schema: {e}")
+
+    def _build_cache_file_path(self, database_id: str) -> str:
+        """Build the full path to the cache file for a given database.
+
+        Args:
+            database_id: ID of the Notion database.
+
+        Returns:
+            Full path to the cache file.
+        """
+        if not os.path.exists(self.CACHE_DIR):
+            os.makedirs(self.CACHE_DIR)
+
+        return os.path.join(self.CACHE_DIR, f"{database_id}.json")
@@ -2,8 +2,10 @@
 # @see API Documentation: https://developers.notion.com/reference/retrieve-a-database
 # @see API Integrations: https://www.notion.so/my-integrations
 
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from src.domain.model.book import Book
+from src.infrastructure.cache.cache_schema import CacheSchema
 
 
 class NotionClient:
@@ -12,58 +14,256 @@ class NotionClient:
     API_URL = "https://api.notion.com"
     API_VERSION = "2022-06-28"
 
-    def __init__(self, api_token, database_id):
+    def __init__(self, api_token, database_id, cache_schema: CacheSchema | None = None):
         super().__init__()
         self.api_token = api_token
         self.database_id = database_id
+        self.cache_schema = cache_schema or CacheSchema()
+        self.schema: dict | None = None
+        self.schema_loaded = False  # Set after the first load attempt, even a failed one
+        self.schema_refreshed = False  # Set after the schema is re-fetched on a rejected page
+        self.select_options: dict[str, dict[str, str]] = {}
 
     def create_book_edition_page(self, book: Book):
-        """Create a book edition"""
+        """Create a book edition, or return None if the payload can't be accepted"""
 
-        return self.create_page(self.format_book_data(book))
+        payload = self.build_book_payload(book)
+        if payload is None:
+            return None
+
+        return self.send_book_payload(book, payload)
+
+    def create_book_edition_pages(self, books: list[Book]) -> list[requests.Response | None]:
+        """Create book editions, building payloads ahead of the sender
+
+        Returns a response for each book, or None for books whose payload was rejected
+        before sending.
+        """
+
+        # Load the schema once before the builder thread starts, so it only reads it
+        self.get_database_schema()
+
+        responses = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for book, payload in zip(books, executor.map(self.build_book_payload, books)):
+                responses.append(
+                    self.send_book_payload(book, payload) if payload is not None else None
+                )
+
+        return responses
+
+    def send_book_payload(self, book: Book, payload: dict):
+        """Create a book edition page, refreshing a stale schema if the page is rejected
+
+        A validated payload can still be rejected when the database changed after its
+        schema was cached. In that case the schema is re-fetched from the API once per
+        client and the payload is rebuilt and sent again.
+        """
+
+        response = self.create_page(payload)
+        if response.status_code != 400 or self.schema is None:
+            return response
+
+        if not self.refresh_database_schema():
+            return response
+
+        rebuilt_payload = self.build_book_payload(book)
+        if rebuilt_payload is None:
+            return None
+
+        return self.create_page(rebuilt_payload)
+
+    def build_book_payload(self, book: Book) -> dict | None:
+        """Format book data and validate it against the database schema"""
+
+        payload = self.format_book_data(book)
+
+        schema = self.get_database_schema()
+        if schema is None:
+            return payload
+
+        return self.validate_payload(payload, schema)
 
     def format_book_data(self, book: Book) -> dict:
         """Format book data for API request"""
 
-        return {
+        properties: dict = {
+            "Name": {
+                "title": [
+                    {
+                        "text": {
+                            "content": book.title
+                        }
+                    }
+                ]
+            },
+            "Publish year": {
+                "number": book.year
+            },
+            "Link": {
+                "url": book.link
+            },
+        }
+
+        if book.publishing_house:
+            properties["Publishing House"] = {
+                "select": {
+                    "name": book.publishing_house
+                }
+            }
+
+        if book.isbn:
+            properties["ISBN"] = {
+                "rich_text": [
+                    {
+                        "type": "text",
+                        "text": {
+                            "content": book.isbn
+                        }
+                    }
+                ]
+            }
+
+        payload: dict = {
             "parent": {"database_id": self.database_id},
-            "cover": {
+            "properties": properties,
+        }
+
+        if book.image_url:
+            payload["cover"] = {
                 "external": {
                     "url": book.image_url
                 }
-            },
-            "properties": {
-                "Name": {
-                    "title": [
-                        {
-                            "text": {
-                                "content": book.title
-                            }
-                        }
-                    ]
-                },
-                "Publish year": {
-                    "number": book.year
-                },
-                "Publishing House": {
+            }
+
+        return payload
+
+    def validate_payload(self, payload: dict, schema: dict) -> dict | None:
+        """Prune properties the database doesn't accept
+
+        Drops properties missing from the schema or having a different type, and maps
+        select values to the existing option names. Returns None if the payload has no
+        title, since Notion rejects such pages.
+        """
+
+        properties = {}
+        has_title = False
+
+        for name, value in payload["properties"].items():
+            property_schema = schema.get(name)
+            property_type = next(iter(value))
+
+            if property_schema is None:
+                print(f"Property skipped, not in database schema: {name} ({property_type})")
+                continue
+
+            if property_schema.get("type") != property_type:
+                print(
+                    f"Property skipped, type mismatch: {name} "
+                    f"(expected {property_schema.get('type')}, got {property_type})"
+                )
+                continue
+
+            if property_type == "select":
+                option_name = value["select"]["name"]
+                value = {
                     "select": {
-                        "name": book.publishing_house
+                        "name": self.select_options.get(name, {}).get(
+                            option_name.casefold(),
+                            option_name
+                        )
                     }
-                },
-                "ISBN": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": book.isbn
-                            }
-                        }
-                    ]
-                },
-                "Link": {
-                    "url": book.link
-                },
+                }
+
+            if property_type == "title":
+                has_title = any(item["text"]["content"] for item in value["title"])
+
+            properties[name] = value
+
+        if not has_title:
+            print("Payload skipped, title is missing")
+            return None
+
+        return {**payload, "properties": properties}
+
+    def get_database_schema(self) -> dict | None:
+        """Get the database property schema from the cache or the API
+
+        The schema is loaded once per client. If loading fails, payloads are sent
+        unvalidated instead of retrying the request for every book.
+        """
+
+        if self.schema_loaded:
+            return self.schema
+
+        self.schema_loaded = True
+
+        schema = self.cache_schema.get(self.database_id)
+        if schema is None:
+            schema = self.retrieve_database_schema()
+            if schema is None:
+                return None
+            self.cache_schema.save(self.database_id, schema)
+
+        self._set_schema(schema)
+
+        return schema
+
+    def refresh_database_schema(self) -> bool:
+        """Re-fetch the database property schema from the API, bypassing the cache
+
+        Only one refresh is made per client, so a batch of rejected pages doesn't spend
+        a request on each of them.
+
+        Returns True if a new schema was loaded.
+        """
+
+        if self.schema_refreshed:
+            return False
+
+        self.schema_refreshed = True
+
+        schema = self.retrieve_database_schema()
+        if schema is None:
+            return False
+
+        self.cache_schema.save(self.database_id, schema)
+        self._set_schema(schema)
+
+        return True
+
+    def retrieve_database_schema(self) -> dict | None:
+        """Retrieve the database property schema"""
+
+        retrieve_url = self.API_URL + "/v1/databases/" + str(self.database_id)
+        try:
+            response = requests.get(retrieve_url, headers=self.get_headers(), timeout=10)
+        except requests.exceptions.RequestException as e:
+            print(f"Error retrieving database schema: {e}")
+            return None
+
+        if response.status_code != 200:
+            print(f"Error retrieving database schema: {response.status_code}")
+            return None
+
+        return response.json().get("properties")
+
+    def _set_schema(self, schema: dict):
+        """Use a property schema together with its select option lookups"""
+
+        self.select_options = self._build_select_options(schema)
+        self.schema = schema
+
+    def _build_select_options(self, schema: dict) -> dict[str, dict[str, str]]:
+        """Build case-insensitive lookups of select option names per property"""
+
+        return {
+            name: {
+                option["name"].casefold(): option["name"]
+                for option in property_schema["select"].get("options", [])
             }
+            for name, property_schema in schema.items()
+            if property_schema.get("type") == "select"
         }
 
     def create_page(self, payload: dict):
@@ -29,13 +29,14 @@ class ObsidianClient: # pylint: disable=too-few-public-methods
 
         Args:
             book: Dictionary containing book metadata (title, authors, year, pages, etc.)
-            image_path: Path to the book cover image file
+            image_path: Path to the book cover image file, its extension is kept for the copy
 
         Returns:
             String message indicating success or error details
         """
 
         template_content = ''
+        cover_name = self._build_cover_name(book, image_path)
 
         # Read a template file
         try:
@@ -50,7 +51,7 @@ class ObsidianClient: # pylint: disable=too-few-public-methods
             "{{aliases}}": self._build_aliases(book),
             "{{year}}": str(book.year),
             "{{pages}}": str(book.pages),
-            "{{image_name}}": book.image_name,
+            "{{image_name}}": cover_name,
             "{{slogan}}": book.slogan_ru,
             "{{book_page_url}}": book.link
         }
@@ -61,8 +62,8 @@ class ObsidianClient: # pylint: disable=too-few-public-methods
         try:
             book_file_path = self._build_book_file_path(book)
             cover_file_path = None
-            if book.image_name:
-                cover_file_path = self._build_cover_file_path(book)
+            if cover_name:
+                cover_file_path = self._build_cover_file_path(cover_name)
         except DirNotExists as e:
             return str(e)
 
@@ -124,10 +125,24 @@ class ObsidianClient: # pylint: disable=too-few-public-methods
 
         return books_dir
 
-    def _build_cover_file_path(self, book: Book) -> str:
-        """Constructs the file path for the book's Markdown file."""
+    def _build_cover_name(self, book: Book, image_path: str | None) -> str:
+        """Builds the cover file name, taking the extension from the actual image file.
+
+        Returns:
+            Cover file name or empty string if the book has no image
+        """
+        if not book.image_name or not image_path:
+            return book.image_name
+
+        name, _ = os.path.splitext(book.image_name)
+        _, ext = os.path.splitext(image_path)
+
+        return f"{name}{ext}"
+
+    def _build_cover_file_path(self, cover_name: str) -> str:
+        """Constructs the file path for the book's cover image."""
         covers_dir = self._get_covers_dir()
-        return os.path.join(covers_dir, book.image_name)
+        return os.path.join(covers_dir, cover_name)
 
     def _get_covers_dir(self) -> str:
         """Get the path to the covers directory from the environment variable or default."""
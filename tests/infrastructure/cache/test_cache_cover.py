@@ -0,0 +1,186 @@
+"""Test cases for the CacheCover class."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from PIL import Image, ImageCms
+from src.infrastructure.cache.cache_cover import CacheCover, _transcode
+
+class TestCacheCover(unittest.TestCase):
+    """Test cases for the CacheCover class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        cache_dir = os.path.join(self.temp_dir.name, 'cover')
+        self.addCleanup(patch.stopall)
+        patch.object(CacheCover, 'CACHE_DIR', cache_dir).start()
+        self.cache_cover = CacheCover(max_size=100, image_format='webp', quality=70)
+
+    def tearDown(self):
+        """Clean up the test environment."""
+        self.temp_dir.cleanup()
+
+    def test_get(self):
+        """Test the get method resizes, re-encodes and strips metadata."""
+
+        image_path = self.make_image('cover.jpg', (400, 600))
+        cover = self.cache_cover.get(image_path)
+
+        self.assertIsNotNone(cover)
+        assert cover is not None
+        self.assertTrue(cover.path.endswith('.webp'))
+        self.assertLess(cover.size, cover.source_size)
+        with Image.open(cover.path) as image:
+            self.assertEqual(image.format, 'WEBP')
+            self.assertEqual(image.size, (67, 100))
+            self.assertNotIn('exif', image.info)
+
+        # Same source and settings are served from the cache
+        with patch('src.infrastructure.cache.cache_cover._transcode') as transcode:
+            self.assertEqual(self.cache_cover.get(image_path), cover)
+        transcode.assert_not_called()
+
+    def test_get_keeps_smaller_original(self):
+        """Test the get method keeps an original that re-encoding would make larger."""
+
+        image_path = os.path.join(self.temp_dir.name, 'small.jpg')
+        Image.effect_noise((300, 450), 100).convert('RGB') \
+            .save(image_path, format='JPEG', quality=25)
+
+        cover = CacheCover().get(image_path)
+
+        assert cover is not None
+        self.assertEqual(cover.path, image_path)
+        self.assertEqual(cover.bytes_saved, 0)
+
+    def test_transcode_palette_image(self):
+        """Test the transcoding resizes palette images with smoothing."""
+
+        image_path = os.path.join(self.temp_dir.name, 'palette.png')
+        image = Image.new('P', (400, 400))
+        image.putpalette([0, 0, 0, 255, 255, 255])
+        image.putdata([(x + y) % 2 for y in range(400) for x in range(400)])
+        image.save(image_path)
+
+        target_path = os.path.join(self.temp_dir.name, 'palette_optimized.png')
+        _transcode(image_path, target_path, 100, 'PNG', 80)
+
+        with Image.open(target_path) as optimized:
+            self.assertEqual(optimized.mode, 'RGB')
+            # A black and white checkerboard averages to grey, NEAREST would keep one color
+            red, _, _ = optimized.getpixel((50, 50))
+            self.assertTrue(64 < red < 192)
+
+    def test_get_color_profile(self):
+        """Test the get method converts a tagged image to sRGB and drops the profile."""
+
+        image_path = os.path.join(self.temp_dir.name, 'tagged.jpg')
+        icc_profile = ImageCms.ImageCmsProfile(ImageCms.createProfile('sRGB')).tobytes()
+        Image.new('RGB', (400, 600), (120, 80, 40)) \
+            .save(image_path, format='JPEG', quality=95, icc_profile=icc_profile)
+
+        cover = self.cache_cover.get(image_path)
+
+        assert cover is not None
+        with Image.open(cover.path) as optimized:
+            self.assertNotIn('icc_profile', optimized.info)
+            red, green, blue = optimized.getpixel((30, 50))
+            self.assertAlmostEqual(red, 120, delta=4)
+            self.assertAlmostEqual(green, 80, delta=4)
+            self.assertAlmostEqual(blue, 40, delta=4)
+
+    def test_get_save_error(self):
+        """Test the get method leaves no temporary file when saving fails."""
+
+        image_path = self.make_image('cover.jpg', (400, 600))
+
+        with patch.object(Image.Image, 'save', side_effect=OSError('disk full')):
+            self.assertIsNone(self.cache_cover.get(image_path))
+
+        self.assertEqual(os.listdir(CacheCover.CACHE_DIR), [])
+
+    def test_get_transcode_error(self):
+        """Test the get method returns None when Pillow rejects the image or settings."""
+
+        image_path = self.make_image('cover.jpg', (400, 600))
+        for error in (ValueError('invalid configuration'), Image.DecompressionBombError('bomb')):
+            with patch('src.infrastructure.cache.cache_cover._transcode', side_effect=error):
+                self.assertIsNone(self.cache_cover.get(image_path))
+
+    def test_get_missing_image(self):
+        """Test the get method with a missing image."""
+
+        self.assertIsNone(self.cache_cover.get(None))
+        self.assertIsNone(self.cache_cover.get(os.path.join(self.temp_dir.name, 'missing.jpg')))
+
+    def test_optimize_batch(self):
+        """Test the optimize_batch method."""
+
+        image_paths = [
+            self.make_image('first.jpg', (300, 200)),
+            self.make_image('second.jpg', (50, 80)),
+            os.path.join(self.temp_dir.name, 'missing.jpg'),
+        ]
+        covers = self.cache_cover.optimize_batch(image_paths, max_workers=2)
+
+        self.assertEqual(sorted(cover.source_path for cover in covers), sorted(image_paths[:2]))
+        for cover in covers:
+            self.assertTrue(os.path.exists(cover.path))
+
+    def test_optimize_batch_with_corrupt_image(self):
+        """Test the optimize_batch method keeps valid covers when one image is corrupt."""
+
+        corrupt_path = os.path.join(self.temp_dir.name, 'corrupt.jpg')
+        with open(corrupt_path, 'wb') as f:
+            f.write(b'not an image')
+
+        image_paths = [
+            self.make_image('first.jpg', (300, 200)),
+            corrupt_path,
+            self.make_image('second.jpg', (50, 80)),
+        ]
+        covers = self.cache_cover.optimize_batch(image_paths, max_workers=2)
+
+        self.assertEqual(
+            sorted(cover.source_path for cover in covers),
+            sorted([image_paths[0], image_paths[2]])
+        )
+
+    def test_optimize_batch_with_same_content(self):
+        """Test the optimize_batch method returns every source sharing an optimized cover."""
+
+        image_paths = [
+            self.make_image('first.jpg', (300, 200)),
+            self.make_image('copy.jpg', (300, 200)),
+        ]
+        covers = self.cache_cover.optimize_batch(image_paths, max_workers=2)
+
+        self.assertEqual(sorted(cover.source_path for cover in covers), sorted(image_paths))
+        self.assertEqual(covers[0].path, covers[1].path)
+
+    def test_settings(self):
+        """Test the quality is clamped and invalid environment settings use defaults."""
+
+        self.assertEqual(CacheCover(quality=150).quality, 100)
+        self.assertEqual(CacheCover(quality=0).quality, 1)
+        self.assertEqual(CacheCover(quality=-5).quality, 1)
+        self.assertEqual(CacheCover(max_size=0).max_size, 1)
+
+        environ = {'COVER_MAX_SIZE': 'big', 'COVER_FORMAT': 'gif', 'COVER_QUALITY': '150'}
+        with patch.dict(os.environ, environ):
+            cache_cover = CacheCover.from_env()
+
+        self.assertEqual(cache_cover.max_size, CacheCover.MAX_SIZE)
+        self.assertEqual(cache_cover.image_format, CacheCover.IMAGE_FORMAT)
+        self.assertEqual(cache_cover.quality, 100)
+
+    def make_image(self, name: str, size: tuple[int, int]) -> str:
+        """Create a JPEG image with EXIF metadata."""
+        image_path = os.path.join(self.temp_dir.name, name)
+        image = Image.new('RGB', size, (120, 80, 40))
+        exif = Image.Exif()
+        exif[0x010F] = 'Camera'
+        image.save(image_path, format='JPEG', quality=95, exif=exif)
+        return image_path
@@ -0,0 +1,39 @@
+"""Test cases for the CacheSchema class."""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from src.infrastructure.cache.cache_schema import CacheSchema
+
+class TestCacheSchema(unittest.TestCase):
+    """Test cases for the CacheSchema class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.temp_dir.cleanup)
+        self.addCleanup(patch.stopall)
+        patch.object(CacheSchema, 'CACHE_DIR', self.temp_dir.name).start()
+
+    def test_save_and_get(self):
+        """Test the save and get methods."""
+
+        cache_schema = CacheSchema()
+        schema = {'Name': {'type': 'title'}}
+
+        self.assertIsNone(cache_schema.get('database_id_str'))
+        cache_schema.save('database_id_str', schema)
+        self.assertEqual(cache_schema.get('database_id_str'), schema)
+
+    def test_get_expired(self):
+        """Test the get method ignores an expired schema."""
+
+        cache_schema = CacheSchema(ttl=60)
+        cache_schema.save('database_id_str', {'Name': {'type': 'title'}})
+
+        expired = time.time() - 120
+        os.utime(os.path.join(self.temp_dir.name, 'database_id_str.json'), (expired, expired))
+
+        self.assertIsNone(cache_schema.get('database_id_str'))
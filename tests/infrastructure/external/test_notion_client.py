@@ -1,6 +1,7 @@
 """Test cases for the NotionClient class."""
 
 import unittest
+from unittest.mock import MagicMock, patch
 from src.domain.model.book import Book
 from src.infrastructure.external.notion_client import NotionClient
 
@@ -9,7 +10,18 @@ class TestNotionClient(unittest.TestCase):
 
     def setUp(self):
         """Set up the test environment."""
+        self.cache_schema = MagicMock()
+        self.cache_schema.get.return_value = {
+            'Name': {'type': 'title'},
+            'Publish year': {'type': 'number'},
+            'Publishing House': {
+                'type': 'select',
+                'select': {'options': [{'name': 'МИФ'}, {'name': 'Other'}]}
+            },
+            'ISBN': {'type': 'rich_text'},
+        }
         self.notion_client = NotionClient('api_key_str', 'database_id_str')
+        self.schema_client = NotionClient('api_key_str', 'database_id_str', self.cache_schema)
 
     def test_format_data(self):
         """Test the format_data method."""
@@ -39,3 +51,126 @@ class TestNotionClient(unittest.TestCase):
             }
         }
         self.assertEqual(self.notion_client.format_book_data(book), data_expected)
+
+    def test_format_data_without_optional_fields(self):
+        """Test the format_data method skips empty ISBN, publisher and cover."""
+
+        book = self.get_book(isbn=None, publishing_house=None, image_url=None)
+        data_expected = {
+            'parent': {'database_id': 'database_id_str'},
+            'properties': {
+                'Link': {'url': 'link_str'},
+                'Name': {'title': [{'text': {'content': 'title_str'}}]},
+                'Publish year': {'number': 1970},
+            }
+        }
+        self.assertEqual(self.notion_client.format_book_data(book), data_expected)
+
+    def test_build_book_payload(self):
+        """Test the build_book_payload method prunes the payload by the schema."""
+
+        payload = self.schema_client.build_book_payload(self.get_book(publishing_house='миф'))
+
+        assert payload is not None
+        self.assertNotIn('Link', payload['properties'])
+        self.assertEqual(payload['properties']['Publishing House'], {'select': {'name': 'МИФ'}})
+        self.assertEqual(payload['properties']['Publish year'], {'number': 1970})
+        self.cache_schema.get.assert_called_once_with('database_id_str')
+
+    def test_build_book_payload_without_title(self):
+        """Test the build_book_payload method rejects a book without a title."""
+
+        self.assertIsNone(self.schema_client.build_book_payload(self.get_book(title='')))
+
+    @patch('src.infrastructure.external.notion_client.requests.get')
+    def test_get_database_schema(self, requests_get):
+        """Test the get_database_schema method fetches and caches a missing schema."""
+
+        schema = {'Name': {'type': 'title'}}
+        self.cache_schema.get.return_value = None
+        requests_get.return_value.status_code = 200
+        requests_get.return_value.json.return_value = {'properties': schema}
+
+        self.assertEqual(self.schema_client.get_database_schema(), schema)
+        self.assertEqual(self.schema_client.get_database_schema(), schema)
+        requests_get.assert_called_once()
+        self.cache_schema.save.assert_called_once_with('database_id_str', schema)
+
+    @patch('src.infrastructure.external.notion_client.requests.get')
+    def test_create_book_edition_pages_without_schema(self, requests_get):
+        """Test the create_book_edition_pages method fetches a failing schema only once."""
+
+        self.cache_schema.get.return_value = None
+        requests_get.return_value.status_code = 503
+        books = [self.get_book(title=f'title_{i}') for i in range(5)]
+
+        with patch.object(self.schema_client, 'create_page') as create_page:
+            self.schema_client.create_book_edition_pages(books)
+
+        self.assertEqual(requests_get.call_count, 1)
+        self.assertEqual(create_page.call_count, 5)
+        self.cache_schema.save.assert_not_called()
+
+    @patch('src.infrastructure.external.notion_client.requests.get')
+    def test_create_book_edition_page_refreshes_schema(self, requests_get):
+        """Test the create_book_edition_page method re-fetches a stale schema once."""
+
+        # The cached schema misses the ISBN property renamed in the database
+        requests_get.return_value.status_code = 200
+        requests_get.return_value.json.return_value = {'properties': {
+            'Name': {'type': 'title'},
+            'ISBN-13': {'type': 'rich_text'},
+        }}
+        rejected = MagicMock(status_code=400)
+        created = MagicMock(status_code=200)
+
+        with patch.object(self.schema_client, 'create_page', side_effect=[rejected, created]) \
+                as create_page:
+            response = self.schema_client.create_book_edition_page(self.get_book())
+
+        self.assertIs(response, created)
+        requests_get.assert_called_once()
+        self.cache_schema.save.assert_called_once()
+        self.assertEqual(
+            list(create_page.call_args_list[1].args[0]['properties']),
+            ['Name']
+        )
+
+        # Later rejections don't fetch the schema again
+        with patch.object(self.schema_client, 'create_page', return_value=rejected):
+            self.assertIs(self.schema_client.create_book_edition_page(self.get_book()), rejected)
+        requests_get.assert_called_once()
+
+    def test_create_book_edition_pages(self):
+        """Test the create_book_edition_pages method doesn't send rejected payloads."""
+
+        books = [self.get_book(), self.get_book(title=''), self.get_book(title='other_str')]
+
+        with patch.object(self.schema_client, 'create_page') as create_page:
+            responses = self.schema_client.create_book_edition_pages(books)
+
+        self.assertEqual(create_page.call_count, 2)
+        self.assertIsNone(responses[1])
+        sent_titles = [
+            call.args[0]['properties']['Name']['title'][0]['text']['content']
+            for call in create_page.call_args_list
+        ]
+        self.assertEqual(sent_titles, ['title_str', 'other_str'])
+
+    def get_book(self, **fields) -> Book:
+        """Create a book with default test data."""
+        data: dict = {
+            'title': "title_str",
+            'title_ru': None,
+            'authors': ['Author Name'],
+            'slogan': None,
+            'slogan_ru': None,
+            'link': "link_str",
+            'year': 1970,
+            'pages': None,
+            'publishing_house': "publishing_house_str",
+            'isbn': "isbn_str",
+            'image_url': "image_url_str",
+        }
+        data.update(fields)
+        return Book(**data)
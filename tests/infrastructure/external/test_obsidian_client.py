@@ -0,0 +1,83 @@
+"""Test cases for the ObsidianClient class."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.domain.model.book import Book
+from src.infrastructure.external.obsidian_client import ObsidianClient
+
+class TestObsidianClient(unittest.TestCase):
+    """Test cases for the ObsidianClient class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.books_dir = os.path.join(self.temp_dir.name, 'books')
+        self.covers_dir = os.path.join(self.temp_dir.name, 'covers')
+        os.makedirs(self.books_dir)
+        os.makedirs(self.covers_dir)
+
+        environ = {'BOOKS_DIR': self.books_dir, 'COVERS_DIR': self.covers_dir}
+        self.addCleanup(patch.stopall)
+        patch.dict(os.environ, environ).start()
+
+        self.obsidian_client = ObsidianClient()
+
+    def test_save_to_notes_with_optimized_cover(self):
+        """Test the save_to_notes method names the cover after the copied image."""
+
+        image_path = os.path.join(self.temp_dir.name, 'optimized.webp')
+        with open(image_path, 'wb') as f:
+            f.write(b'webp_content')
+
+        self.obsidian_client.save_to_notes(self.get_book('title_str.jpg'), image_path)
+
+        self.assertEqual(os.listdir(self.covers_dir), ['title_str.webp'])
+        self.assertIn('title_str.webp', self.read_note())
+        self.assertNotIn('title_str.jpg', self.read_note())
+
+    def test_save_to_notes_without_image_path(self):
+        """Test the save_to_notes method keeps the image name when there is no image."""
+
+        self.obsidian_client.save_to_notes(self.get_book('title_str.jpg'), None)
+
+        self.assertEqual(os.listdir(self.covers_dir), [])
+        self.assertIn('title_str.jpg', self.read_note())
+
+    def test_save_to_notes_without_image_name(self):
+        """Test the save_to_notes method doesn't copy a cover for a book without an image."""
+
+        image_path = os.path.join(self.temp_dir.name, 'optimized.webp')
+        with open(image_path, 'wb') as f:
+            f.write(b'webp_content')
+
+        self.obsidian_client.save_to_notes(self.get_book(''), image_path)
+
+        self.assertEqual(os.listdir(self.covers_dir), [])
+        self.assertNotIn('.webp', self.read_note())
+
+    def read_note(self) -> str:
+        """Read the saved note of the test book."""
+        with open(os.path.join(self.books_dir, 'title_str.md'), encoding='utf-8') as f:
+            return f.read()
+
+    def get_book(self, image_name: str) -> Book:
+        """Create a book with the given image name."""
+        return Book(
+            title = "title_str",
+            title_ru = None,
+            authors = ['Author Name'],
+            slogan = None,
+            slogan_ru = None,
+            year = 1970,
+            pages = 100,
+            publishing_house = None,
+            isbn = None,
+            image_url = None,
+            link = "link_str",
+            title_clean = "title_str",
+            image_name = image_name,
+        )